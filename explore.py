@@ -15,13 +15,13 @@ def initialize_controller():
     joystick.init()
     return joystick
 
-def get_controller_input(joystick):
-    pygame.event.pump()  # Process event queue
+def get_controller_input(joystick, axis_ids, button_ids, hat_ids):
+    pygame.event.get()  # Process and drain the event queue
 
     # Read joystick axes, buttons, and hats
-    axes = [joystick.get_axis(i) for i in range(joystick.get_numaxes())]
-    buttons = [joystick.get_button(i) for i in range(joystick.get_numbuttons())]
-    hats = [joystick.get_hat(i) for i in range(joystick.get_numhats())]
+    axes = list(map(joystick.get_axis, axis_ids))
+    buttons = list(map(joystick.get_button, button_ids))
+    hats = list(map(joystick.get_hat, hat_ids))
 
     return axes, buttons, hats
 
@@ -33,9 +33,14 @@ def main():
 
     print(f"Controller connected: {joystick.get_name()}")
 
+    # Control counts are fixed for a connected device, so query them once
+    axis_ids = range(joystick.get_numaxes())
+    button_ids = range(joystick.get_numbuttons())
+    hat_ids = range(joystick.get_numhats())
+
     try:
         while True:
-            axes, buttons, hats = get_controller_input(joystick)
+            axes, buttons, hats = get_controller_input(joystick, axis_ids, button_ids, hat_ids)
             # print(f"Axes: {axes}")
             print(f"Buttons: {buttons}")
             # print(f"Hats: {hats}")
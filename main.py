@@ -1,7 +1,8 @@
 from fastapi import FastAPI, HTTPException
 import pygame
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import os
+import time
 
 app = FastAPI(
     title="Turtle Beach Recon Controller Input API", 
@@ -13,7 +14,13 @@ X_BUTTON_INDEX = 2
 A_BUTTON_INDEX = 0
 LEFT_STICK_X_AXIS = 0
 RIGHT_TRIGGER_AXIS = 5
+EVENT_PUMP_PERIOD = 1 / 60  # Seconds; pump the event queue no faster than ~60 Hz
+JOYSTICK_EVENT_TYPES = frozenset((
+    pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION
+))
 joystick = None
+last_event_pump = 0.0
+last_input: Optional[Dict[str, Any]] = None
 
 # Initialize Pygame and Joystick
 pygame.init()
@@ -33,23 +40,47 @@ def initialize_joystick() -> None:
 
 initialize_joystick()
 
+def drain_events() -> List[pygame.event.Event]:
+    """
+    Processes the event queue and removes every pending event in a single batch.
+
+    Returns:
+        The events that were pending, oldest first.
+    """
+    return pygame.event.get()
+
 def get_speed_and_steering() -> Dict[str, Any]:
     """
     Retrieves the current positions of the left stick X-axis and the right trigger axis.
 
+    The joystick is only read again when new joystick events have arrived; otherwise
+    the previously read input is returned.
+
     Returns:
         A dictionary containing the positions of the left stick X-axis and the right trigger axis.
     """
+    global last_event_pump, last_input
     if not joystick:
         raise HTTPException(status_code=404, detail="Joystick not initialized")
-    
-    pygame.event.pump()  # Process event queue
-    return {
-        'left_stick_x_axis': joystick.get_axis(LEFT_STICK_X_AXIS), 
-        'right_trigger_axis': joystick.get_axis(RIGHT_TRIGGER_AXIS),
-        'x_button_pressed': joystick.get_button(X_BUTTON_INDEX) == 1,
-        'a_button_pressed': joystick.get_button(A_BUTTON_INDEX) == 1
+
+    joystick_changed = False
+    now = time.monotonic()
+    if now - last_event_pump >= EVENT_PUMP_PERIOD:
+        joystick_changed = any(event.type in JOYSTICK_EVENT_TYPES for event in drain_events())
+        last_event_pump = now
+
+    if not joystick_changed and last_input is not None:
+        return dict(last_input)  # Callers may add keys, so never hand out the cache
+
+    get_axis = joystick.get_axis
+    get_button = joystick.get_button
+    last_input = {
+        'left_stick_x_axis': get_axis(LEFT_STICK_X_AXIS),
+        'right_trigger_axis': get_axis(RIGHT_TRIGGER_AXIS),
+        'x_button_pressed': get_button(X_BUTTON_INDEX) == 1,
+        'a_button_pressed': get_button(A_BUTTON_INDEX) == 1
     }
+    return dict(last_input)
 
 @app.get("/controller-input", response_model=Dict[str, Any])
 async def controller_input() -> Dict[str, Any]: